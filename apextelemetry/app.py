@@ -1,12 +1,21 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session as flask_session, abort
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from flask.json.provider import DefaultJSONProvider
 from flask_bcrypt import Bcrypt
 from models import db, User, RaceSession, CarData, Comparison
-from f1_api import F1APIService
-from datetime import datetime, timedelta
+from f1_api import F1APIService, as_records
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import defer, raiseload
 import os
-import json
-import ast
+import re
+import secrets
+import hmac
+import hashlib
+import time
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 
 # Optional email support
@@ -17,17 +26,71 @@ except ImportError:
     MAIL_AVAILABLE = False
     print("Warning: Flask-Mail not installed. Email notifications will be disabled.")
 
+# Optional Redis for holding generated comparisons between requests
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional Arrow support for bulk telemetry downloads
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
 load_dotenv()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson (native datetime and numpy support)"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///apextelemetry.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# JSON columns are written with orjson (datetimes as ISO strings, NaN/Infinity as null)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'json_serializer': lambda obj: orjson.dumps(obj).decode('utf-8')}
 app.config['SESSION_TYPE'] = 'filesystem'
 app.config['SESSION_FILE_DIR'] = os.path.join(os.getcwd(), 'flask_session')
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_USE_SIGNER'] = False
 
+# Password hashing configuration (OWASP minimum cost by default, capped so login cannot be used to pin workers)
+MAX_BCRYPT_LOG_ROUNDS = 12
+app.config['BCRYPT_LOG_ROUNDS'] = min(int(os.getenv('BCRYPT_LOG_ROUNDS', 10)), MAX_BCRYPT_LOG_ROUNDS)
+
+# Recently verified credentials, keyed by HMAC fingerprint so plaintext passwords are never held
+LOGIN_PEPPER = os.getenv('LOGIN_PEPPER', app.config['SECRET_KEY']).encode('utf-8')
+LOGIN_CACHE_TTL = 60  # seconds
+LOGIN_CACHE_MAX_SIZE = 4096
+verified_logins = {}
+
+# Generated comparisons stay saveable for this long when stashed in Redis (seconds)
+COMPARISON_STASH_TTL = 600
+COMPARISON_FIELDS = ('comparison_data1', 'comparison_data2', 'comparison_driver1', 'comparison_driver2', 'comparison_race_date')
+
+# Per-lap metrics charted for each driver in a comparison
+TELEMETRY_FIELDS = ('speed', 'rpm', 'lap_time', 'tire_temp', 'tire_wear', 'sector_time', 'position')
+
+# Session data is served in this format to clients that ask for it (requires pyarrow)
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+# Race selection form value: "year|round|YYYY-MM-DD"
+RACE_SELECTION_RE = re.compile(r'(\d+)\|(\d+)\|(\d{4}-\d{2}-\d{2})')
+
 # Email configuration
 app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
 app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
@@ -39,11 +102,31 @@ app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD', '')
 db.init_app(app)
 bcrypt = Bcrypt(app)
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so chart reads don't block on telemetry writes, and tune SQLite for this workload"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.close()
+
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', set_sqlite_pragmas)
+
+# Verified against when no user matches, so unknown usernames cost the same bcrypt time as wrong passwords
+DUMMY_PASSWORD_HASH = bcrypt.generate_password_hash(os.urandom(16).hex()).decode('utf-8')
+
 if MAIL_AVAILABLE:
     mail = Mail(app)
 else:
     mail = None
 
+# SMTP sends run in the background so notifications don't add to request latency
+mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='mail')
+
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 login_manager.login_message = 'Please log in to access this page.'
@@ -55,7 +138,10 @@ try:
 except ImportError:
     print("Warning: Flask-Session not installed. Using cookie-based sessions (limited to 4KB).")
 
-f1_api = F1APIService()
+f1_api = F1APIService(redis_url=os.getenv('REDIS_URL'), cache_dir=os.getenv('F1_CACHE_DIR'))
+
+# Unsaved comparisons are held here when Redis is configured, otherwise in the user's session
+comparison_stash = redis.Redis.from_url(os.getenv('REDIS_URL')) if REDIS_AVAILABLE and os.getenv('REDIS_URL') else None
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -74,12 +160,15 @@ def register():
         email = request.form.get('email')
         password = request.form.get('password')
         
-        if User.query.filter_by(username=username).first():
-            flash('Username already exists', 'error')
-            return render_template('register.html')
+        # Run both uniqueness checks before responding so timing doesn't reveal which one failed first
+        username_taken = User.query.filter_by(username=username).first() is not None
+        email_taken = User.query.filter_by(email=email).first() is not None
         
-        if User.query.filter_by(email=email).first():
-            flash('Email already exists', 'error')
+        if username_taken or email_taken:
+            if username_taken:
+                flash('Username already exists', 'error')
+            if email_taken:
+                flash('Email already exists', 'error')
             return render_template('register.html')
         
         hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
@@ -100,7 +189,17 @@ def login():
         
         user = User.query.filter_by(username=username).first()
         
-        if user and bcrypt.check_password_hash(user.password, password):
+        if user:
+            valid = verify_password(user, password)
+        else:
+            bcrypt.check_password_hash(DUMMY_PASSWORD_HASH, password or '')
+            valid = False
+        
+        if valid:
+            # Strengthen hashes created under a lower bcrypt cost now that we have the plaintext
+            if password_needs_rehash(user.password):
+                user.password = bcrypt.generate_password_hash(password).decode('utf-8')
+                db.session.commit()
             login_user(user)
             return redirect(url_for('dashboard'))
         else:
@@ -118,9 +217,18 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    sessions = RaceSession.query.filter_by(user_id=current_user.id).all()
-    comparisons = Comparison.query.filter_by(user_id=current_user.id).order_by(Comparison.created_at.desc()).all()
-    return render_template('dashboard.html', sessions=sessions, comparisons=comparisons)
+    sessions = RaceSession.query.options(raiseload('*')).filter_by(user_id=current_user.id).all()
+    comparisons = Comparison.query.options(raiseload('*'), defer(Comparison.data1), defer(Comparison.data2)).filter_by(user_id=current_user.id).order_by(Comparison.created_at.desc()).all()
+    
+    # Count data points per session in one grouped query instead of lazy-loading car_data per session
+    data_counts = dict(
+        db.session.query(CarData.session_id, func.count(CarData.id))
+        .join(RaceSession, RaceSession.id == CarData.session_id)
+        .filter(RaceSession.user_id == current_user.id)
+        .group_by(CarData.session_id)
+        .all()
+    )
+    return render_template('dashboard.html', sessions=sessions, comparisons=comparisons, data_counts=data_counts)
 
 @app.route('/session/new', methods=['GET', 'POST'])
 @login_required
@@ -130,44 +238,25 @@ def new_session():
         driver_name = request.form.get('driver_name')
         race_selection = request.form.get('race_selection')  # Format: "year|round|date"
         
-        # Parse race selection
-        if race_selection:
-            parts = race_selection.split('|')
-            race_year = int(parts[0]) if len(parts) > 0 else datetime.now().year
-            race_round = int(parts[1]) if len(parts) > 1 else 1
-            race_date = parts[2] if len(parts) > 2 else datetime.now().strftime('%Y-%m-%d')
-        else:
-            race_date = datetime.now().strftime('%Y-%m-%d')
-            race_year = datetime.now().year
-            race_round = 1
+        # Parse race selection, defaulting to today when missing or malformed
+        selection = parse_race_selection(race_selection)
+        race_date = selection[2] if selection else datetime.now().strftime('%Y-%m-%d')
         
         # Create new session
         race_session = RaceSession(
             name=session_name,
             driver_name=driver_name,
-            race_date=datetime.strptime(race_date, '%Y-%m-%d') if race_date else datetime.now(),
+            race_date=datetime.fromisoformat(race_date),
             user_id=current_user.id
         )
         db.session.add(race_session)
-        db.session.commit()
+        db.session.flush()  # Assigns race_session.id; committed together with its telemetry below
         
         # Fetch data from F1 API
         try:
             data = f1_api.fetch_race_data(driver_name, race_date)
             if data:
-                for entry in data:
-                    car_data = CarData(
-                        session_id=race_session.id,
-                        speed=entry.get('speed', 0),
-                        rpm=entry.get('rpm', 0),
-                        lap_time=entry.get('lap_time', 0),
-                        tire_temp=entry.get('tire_temp', 0),
-                        tire_wear=entry.get('tire_wear', 0),
-                        sector_time=entry.get('sector_time', 0),
-                        position=entry.get('position', 0),
-                        timestamp=entry.get('timestamp', datetime.now())
-                    )
-                    db.session.add(car_data)
+                db.session.execute(insert(CarData), build_car_data_rows(race_session.id, data))
                 db.session.commit()
                 
                 # Send notification email
@@ -177,15 +266,18 @@ def new_session():
                     f"New F1 Session Created: {session_name}",
                     f"Your F1 telemetry session '{session_name}' for driver {driver_name} has been created successfully.\n\n"
                     f"Race Date: {race_date}\n"
-                    f"Data Points: {len(data)}\n\n"
+                    f"Data Points: {len(data['lap'])}\n\n"
                     f"View your session at: {session_url}"
                 )
                 
                 flash('Session created and historical data fetched successfully!', 'success')
             else:
+                db.session.commit()
                 flash('No data found for the specified driver/date', 'warning')
         except Exception as e:
+            db.session.rollback()
             flash(f'Error fetching data: {str(e)}', 'error')
+            return redirect(url_for('new_session'))
         
         return redirect(url_for('view_session', session_id=race_session.id))
     
@@ -202,8 +294,11 @@ def view_session(session_id):
         flash('You do not have access to this session', 'error')
         return redirect(url_for('dashboard'))
     
-    car_data = CarData.query.filter_by(session_id=session_id).order_by(CarData.timestamp).all()
-    return render_template('view_session.html', session=race_session, car_data=car_data)
+    # Charts fetch their data from get_session_data; the page only needs to know whether any exists
+    has_data = db.session.execute(
+        select(CarData.id).where(CarData.session_id == session_id).limit(1)
+    ).first() is not None
+    return render_template('view_session.html', session=race_session, has_data=has_data)
 
 @app.route('/session/<int:session_id>/data')
 @login_required
@@ -213,20 +308,34 @@ def get_session_data(session_id):
     if race_session.user_id != current_user.id:
         return jsonify({'error': 'Unauthorized'}), 403
     
-    car_data = CarData.query.filter_by(session_id=session_id).order_by(CarData.timestamp).all()
+    # Select only the charted columns and transpose rows into columns without ORM hydration
+    rows = db.session.execute(
+        select(CarData.timestamp, CarData.speed, CarData.rpm, CarData.lap_time, CarData.tire_temp,
+               CarData.tire_wear, CarData.sector_time, CarData.position)
+        .where(CarData.session_id == session_id)
+        .order_by(CarData.timestamp)
+    ).all()
+    timestamps, speed, rpm, lap_time, tire_temp, tire_wear, sector_time, position = zip(*rows) if rows else ((),) * 8
     
     data = {
-        'timestamps': [d.timestamp.isoformat() for d in car_data],
-        'speed': [d.speed for d in car_data],
-        'rpm': [d.rpm for d in car_data],
-        'lap_time': [d.lap_time for d in car_data],
-        'tire_temp': [d.tire_temp for d in car_data],
-        'tire_wear': [d.tire_wear for d in car_data],
-        'sector_time': [d.sector_time for d in car_data],
-        'position': [d.position for d in car_data]
+        'timestamps': list(timestamps),
+        'speed': list(speed),
+        'rpm': list(rpm),
+        'lap_time': list(lap_time),
+        'tire_temp': list(tire_temp),
+        'tire_wear': list(tire_wear),
+        'sector_time': list(sector_time),
+        'position': list(position)
     }
     
-    return jsonify(data)
+    # Dataframe clients (pandas/polars) can request the columns as an Arrow IPC stream instead of JSON
+    if ARROW_AVAILABLE and request.accept_mimetypes.best_match(['application/json', ARROW_STREAM_MIMETYPE]) == ARROW_STREAM_MIMETYPE:
+        response = arrow_stream_response(data)
+    else:
+        response = jsonify(data)
+    # The body depends on the Accept header, so caches must key on it
+    response.vary.add('Accept')
+    return response
 
 @app.route('/session/<int:session_id>/delete', methods=['POST'])
 @login_required
@@ -238,7 +347,7 @@ def delete_session(session_id):
         return redirect(url_for('dashboard'))
     
     # Delete associated car data
-    CarData.query.filter_by(session_id=session_id).delete()
+    db.session.execute(delete(CarData).where(CarData.session_id == session_id))
     db.session.delete(race_session)
     db.session.commit()
     
@@ -292,30 +401,12 @@ def refresh_data(session_id):
         data = f1_api.fetch_race_data(race_session.driver_name, race_session.race_date.strftime('%Y-%m-%d'))
         if data:
             # Clear existing data
-            CarData.query.filter_by(session_id=session_id).delete()
-            
-            # Check for pit stops (significant tire wear changes)
-            previous_wear = None
-            pit_stops = []
+            db.session.execute(delete(CarData).where(CarData.session_id == session_id))
+            db.session.execute(insert(CarData), build_car_data_rows(race_session.id, data))
             
-            for entry in data:
-                car_data = CarData(
-                    session_id=race_session.id,
-                    speed=entry.get('speed', 0),
-                    rpm=entry.get('rpm', 0),
-                    lap_time=entry.get('lap_time', 0),
-                    tire_temp=entry.get('tire_temp', 0),
-                    tire_wear=entry.get('tire_wear', 0),
-                    sector_time=entry.get('sector_time', 0),
-                    position=entry.get('position', 0),
-                    timestamp=entry.get('timestamp', datetime.now())
-                )
-                db.session.add(car_data)
-                
-                # Detect pit stops (tire wear drops significantly)
-                if previous_wear is not None and entry.get('tire_wear', 0) < previous_wear - 20:
-                    pit_stops.append(entry.get('lap', 0))
-                previous_wear = entry.get('tire_wear', 0)
+            # Detect pit stops (tire wear drops by more than 20% between consecutive laps)
+            pit_stop_indices = np.flatnonzero(np.diff(data['tire_wear']) < -20) + 1
+            pit_stops = data['lap'][pit_stop_indices].tolist()
             
             db.session.commit()
             
@@ -333,6 +424,7 @@ def refresh_data(session_id):
         else:
             return jsonify({'success': False, 'message': 'No data found'})
     except Exception as e:
+            db.session.rollback()
             return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/compare', methods=['GET', 'POST'])
@@ -353,47 +445,39 @@ def compare_drivers():
             return redirect(url_for('compare_drivers'))
         
         # Parse race selection
-        parts = race_selection.split('|')
-        race_date = parts[2] if len(parts) > 2 else datetime.now().strftime('%Y-%m-%d')
+        selection = parse_race_selection(race_selection)
+        if not selection:
+            flash('Invalid race selection', 'error')
+            return redirect(url_for('compare_drivers'))
+        _, _, race_date = selection
         
         # Fetch data for both drivers
         try:
-            data1 = f1_api.fetch_race_data(driver1_name, race_date)
-            data2 = f1_api.fetch_race_data(driver2_name, race_date)
+            data1, data2 = f1_api.fetch_race_data_for_drivers([driver1_name, driver2_name], race_date)
             
             if not data1 or not data2:
                 flash('Could not fetch data for one or both drivers', 'error')
                 return redirect(url_for('compare_drivers'))
             
-            # Convert datetime objects to strings for JSON serialization
-            def serialize_data(data):
-                result = []
-                for entry in data:
-                    serialized = {}
-                    for key, value in entry.items():
-                        if isinstance(value, datetime):
-                            serialized[key] = value.isoformat()
-                        else:
-                            serialized[key] = value
-                    result.append(serialized)
-                return result
-            
-            data1_serialized = serialize_data(data1)
-            data2_serialized = serialize_data(data2)
+            # Templates and saved comparisons use one dict per lap
+            data1, data2 = as_records(data1), as_records(data2)
             
-            # Store data in session to avoid form size limits
-            flask_session['comparison_data1'] = data1_serialized
-            flask_session['comparison_data2'] = data2_serialized
-            flask_session['comparison_driver1'] = driver1_name
-            flask_session['comparison_driver2'] = driver2_name
-            flask_session['comparison_race_date'] = race_date
+            # Keep data server-side until saved to avoid form size limits
+            # (orjson serializes the datetime timestamps when stashed, rendered or saved)
+            stash_comparison({
+                'comparison_data1': data1,
+                'comparison_data2': data2,
+                'comparison_driver1': driver1_name,
+                'comparison_driver2': driver2_name,
+                'comparison_race_date': race_date
+            })
             
             return render_template('compare_results.html', 
                                  driver1_name=driver1_name,
                                  driver2_name=driver2_name,
                                  race_date=race_date,
-                                 data1=data1_serialized,
-                                 data2=data2_serialized)
+                                 data1=data1,
+                                 data2=data2)
         except Exception as e:
             flash(f'Error fetching comparison data: {str(e)}', 'error')
             return redirect(url_for('compare_drivers'))
@@ -415,36 +499,15 @@ def get_compare_data():
         return jsonify({'error': 'Missing required parameters'}), 400
     
     try:
-        data1 = f1_api.fetch_race_data(driver1_name, race_date)
-        data2 = f1_api.fetch_race_data(driver2_name, race_date)
+        data1, data2 = f1_api.fetch_race_data_for_drivers([driver1_name, driver2_name], race_date)
         
         if not data1 or not data2:
             return jsonify({'error': 'Could not fetch data for one or both drivers'}), 404
         
         # Format data for comparison
         result = {
-            'driver1': {
-                'name': driver1_name,
-                'speed': [d.get('speed', 0) for d in data1],
-                'rpm': [d.get('rpm', 0) for d in data1],
-                'lap_time': [d.get('lap_time', 0) for d in data1],
-                'tire_temp': [d.get('tire_temp', 0) for d in data1],
-                'tire_wear': [d.get('tire_wear', 0) for d in data1],
-                'sector_time': [d.get('sector_time', 0) for d in data1],
-                'position': [d.get('position', 0) for d in data1],
-                'timestamps': [d.get('timestamp', datetime.now()).isoformat() if isinstance(d.get('timestamp'), datetime) else str(d.get('timestamp', '')) for d in data1]
-            },
-            'driver2': {
-                'name': driver2_name,
-                'speed': [d.get('speed', 0) for d in data2],
-                'rpm': [d.get('rpm', 0) for d in data2],
-                'lap_time': [d.get('lap_time', 0) for d in data2],
-                'tire_temp': [d.get('tire_temp', 0) for d in data2],
-                'tire_wear': [d.get('tire_wear', 0) for d in data2],
-                'sector_time': [d.get('sector_time', 0) for d in data2],
-                'position': [d.get('position', 0) for d in data2],
-                'timestamps': [d.get('timestamp', datetime.now()).isoformat() if isinstance(d.get('timestamp'), datetime) else str(d.get('timestamp', '')) for d in data2]
-            }
+            'driver1': telemetry_columns(driver1_name, data1),
+            'driver2': telemetry_columns(driver2_name, data2)
         }
         
         return jsonify(result)
@@ -454,12 +517,13 @@ def get_compare_data():
 @app.route('/comparison/save', methods=['POST'])
 @login_required
 def save_comparison():
-    # Get data from session instead of form to avoid size limits
-    data1_parsed = flask_session.pop('comparison_data1', None)
-    data2_parsed = flask_session.pop('comparison_data2', None)
-    driver1_name = flask_session.pop('comparison_driver1', None)
-    driver2_name = flask_session.pop('comparison_driver2', None)
-    race_date = flask_session.pop('comparison_race_date', None)
+    # Get data from the server-side stash instead of form to avoid size limits
+    stashed = pop_stashed_comparison()
+    data1_parsed = stashed.get('comparison_data1')
+    data2_parsed = stashed.get('comparison_data2')
+    driver1_name = stashed.get('comparison_driver1')
+    driver2_name = stashed.get('comparison_driver2')
+    race_date = stashed.get('comparison_race_date')
 
     if not all([driver1_name, driver2_name, data1_parsed, data2_parsed]):
         flash('Comparison data not found. Please generate a comparison first.', 'error')
@@ -469,9 +533,9 @@ def save_comparison():
         user_id=current_user.id,
         driver1_name=driver1_name,
         driver2_name=driver2_name,
-        data1=json.dumps(data1_parsed),  # Store as clean JSON
-        data2=json.dumps(data2_parsed),
-        race_date=race_date
+        data1=data1_parsed,
+        data2=data2_parsed,
+        race_date=date.fromisoformat(race_date) if race_date else None
     )
     db.session.add(comparison)
     db.session.commit()
@@ -496,30 +560,15 @@ def delete_comparison(comp_id):
 @app.route('/comparison/<int:comp_id>')
 @login_required
 def view_comparison(comp_id):
-    comp = Comparison.query.get_or_404(comp_id)
+    # Telemetry payloads are decoded separately so a corrupt stored row can be reported instead of failing the request
+    comp = Comparison.query.options(defer(Comparison.data1), defer(Comparison.data2)).get_or_404(comp_id)
     if comp.user_id != current_user.id:
         abort(403)
 
-    def clean_json(s):
-        # Replace JSON representations of NaN and Infinity with null
-        s = s.replace('"NaN"', 'null').replace('"Infinity"', 'null').replace('"-Infinity"', 'null')
-        return s
-
-    data1_str = clean_json(comp.data1)
-    data2_str = clean_json(comp.data2)
-
-    def parse_data(s):
-        try:
-            return json.loads(s)
-        except json.JSONDecodeError:
-            try:
-                return ast.literal_eval(s)
-            except (ValueError, SyntaxError):
-                raise ValueError("Invalid data format")
-
     try:
-        data1 = parse_data(data1_str)
-        data2 = parse_data(data2_str)
+        data1, data2 = db.session.execute(
+            select(Comparison.data1, Comparison.data2).where(Comparison.id == comp_id)
+        ).one()
     except ValueError as e:
         flash(f'Error loading comparison data: {e}', 'error')
         return redirect(url_for('dashboard'))
@@ -541,20 +590,18 @@ def delete_account():
     if request.method == 'POST':
         # Check confirmation
         confirmation = request.form.get('confirmation', '').strip()
-        if confirmation != 'DELETE':
+        if not hmac.compare_digest(confirmation.encode('utf-8'), b'DELETE'):
             flash('Please type "DELETE" to confirm account deletion.', 'error')
             return redirect(url_for('delete_account'))
         
         try:
-            # Delete all user's sessions and associated car data
-            sessions = RaceSession.query.filter_by(user_id=current_user.id).all()
-            for session in sessions:
-                # Delete associated car data
-                CarData.query.filter_by(session_id=session.id).delete()
-                db.session.delete(session)
+            # Delete all user's car data and sessions in bulk
+            session_ids = select(RaceSession.id).where(RaceSession.user_id == current_user.id)
+            db.session.execute(delete(CarData).where(CarData.session_id.in_(session_ids)))
+            RaceSession.query.filter_by(user_id=current_user.id).delete(synchronize_session=False)
             
             # Delete all user's comparisons
-            Comparison.query.filter_by(user_id=current_user.id).delete()
+            Comparison.query.filter_by(user_id=current_user.id).delete(synchronize_session=False)
             
             # Delete the user account
             db.session.delete(current_user)
@@ -584,25 +631,14 @@ def change_password():
         confirm_password = request.form.get('confirm_password')
         
         # Validate current password
-        if not bcrypt.check_password_hash(current_user.password, current_password):
+        if not verify_password(current_user, current_password):
             flash('Current password is incorrect.', 'error')
             return redirect(url_for('change_password'))
         
         # Validate new password
-        if len(new_password) < 8:
-            flash('New password must be at least 8 characters long.', 'error')
-            return redirect(url_for('change_password'))
-        
-        if not any(c.isupper() for c in new_password):
-            flash('New password must contain at least one uppercase letter.', 'error')
-            return redirect(url_for('change_password'))
-        
-        if not any(c.islower() for c in new_password):
-            flash('New password must contain at least one lowercase letter.', 'error')
-            return redirect(url_for('change_password'))
-        
-        if not any(c.isdigit() for c in new_password):
-            flash('New password must contain at least one number.', 'error')
+        password_error = password_rule_error(new_password or '')
+        if password_error:
+            flash(password_error, 'error')
             return redirect(url_for('change_password'))
         
         # Check password confirmation
@@ -611,7 +647,7 @@ def change_password():
             return redirect(url_for('change_password'))
         
         # Check if new password is different from current
-        if bcrypt.check_password_hash(current_user.password, new_password):
+        if verify_password(current_user, new_password):
             flash('New password must be different from your current password.', 'error')
             return redirect(url_for('change_password'))
         
@@ -630,27 +666,159 @@ def change_password():
     
     return render_template('change_password.html')
 
+def parse_race_selection(race_selection):
+    """Parse a "year|round|date" race selection into (year, round, date), or None if malformed or not a real date"""
+    match = RACE_SELECTION_RE.fullmatch(race_selection or '')
+    if not match:
+        return None
+    year, round_num, race_date = match.groups()
+    try:
+        date.fromisoformat(race_date)
+    except ValueError:
+        return None
+    return int(year), int(round_num), race_date
+
+def telemetry_columns(name, data):
+    """Select the charted metrics from F1 API telemetry columns (arrays are serialized as-is by orjson)"""
+    columns = {'name': name}
+    for field in TELEMETRY_FIELDS:
+        columns[field] = data[field]
+    columns['timestamps'] = data['timestamp']
+    return columns
+
+def arrow_stream_response(columns):
+    """Encode a dict of equal-length columns as an Arrow IPC stream response"""
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return app.response_class(sink.getvalue().to_pybytes(), mimetype=ARROW_STREAM_MIMETYPE)
+
+def build_car_data_rows(session_id, data):
+    """Build CarData insert mappings from F1 API telemetry columns"""
+    columns = [data[field].tolist() for field in TELEMETRY_FIELDS]
+    return [
+        dict(zip(TELEMETRY_FIELDS, values), session_id=session_id, timestamp=timestamp)
+        for timestamp, *values in zip(data['timestamp'], *columns)
+    ]
+
+def verify_password(user, password):
+    """Check a password against the user's bcrypt hash, reusing recent successful checks"""
+    if not password:
+        # Spend the same bcrypt work as the unknown-username path so timing does not reveal the account exists
+        bcrypt.check_password_hash(DUMMY_PASSWORD_HASH, '')
+        return False
+    
+    fingerprint = hmac.new(LOGIN_PEPPER, f"{user.id}:{password}".encode('utf-8'), hashlib.sha256).digest()
+    now = time.monotonic()
+    
+    # Cache hits are only valid while the stored hash is unchanged (password changes invalidate them)
+    cached = verified_logins.get(fingerprint)
+    if cached and cached[0] == user.password and cached[1] > now:
+        return True
+    
+    if not bcrypt.check_password_hash(user.password, password):
+        return False
+    
+    if len(verified_logins) >= LOGIN_CACHE_MAX_SIZE:
+        for key, (_, expires_at) in list(verified_logins.items()):
+            if expires_at <= now:
+                verified_logins.pop(key, None)
+        if len(verified_logins) >= LOGIN_CACHE_MAX_SIZE:
+            verified_logins.clear()
+    verified_logins[fingerprint] = (user.password, now + LOGIN_CACHE_TTL)
+    return True
+
+def password_rule_error(password):
+    """Return the message for the first password rule broken, or None (one pass; letters and digits of any script count)"""
+    if len(password) < 8:
+        return 'New password must be at least 8 characters long.'
+    
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+    
+    if not has_upper:
+        return 'New password must contain at least one uppercase letter.'
+    if not has_lower:
+        return 'New password must contain at least one lowercase letter.'
+    if not has_digit:
+        return 'New password must contain at least one number.'
+    return None
+
+def password_needs_rehash(password_hash):
+    """Check whether a bcrypt hash was generated with a lower cost than configured (costlier hashes are kept)"""
+    try:
+        return int(password_hash.split('$')[2]) < app.config['BCRYPT_LOG_ROUNDS']
+    except (IndexError, ValueError):
+        return False
+
+def stash_comparison(payload):
+    """Hold a generated comparison until it is saved, in Redis if available (only a token goes in the session)"""
+    if comparison_stash is not None:
+        token = secrets.token_urlsafe(16)
+        try:
+            comparison_stash.setex(f"comparison:{token}", COMPARISON_STASH_TTL, orjson.dumps(payload))
+            flask_session['comparison_token'] = token
+            return
+        except redis.RedisError as e:
+            print(f"Error stashing comparison in Redis: {e}")
+    
+    flask_session.update(payload)
+
+def pop_stashed_comparison():
+    """Retrieve and remove the comparison held by stash_comparison"""
+    token = flask_session.pop('comparison_token', None)
+    if token and comparison_stash is not None:
+        key = f"comparison:{token}"
+        try:
+            pipeline = comparison_stash.pipeline()
+            pipeline.get(key)
+            pipeline.delete(key)
+            payload, _ = pipeline.execute()
+            if payload:
+                return orjson.loads(payload)
+        except redis.RedisError as e:
+            print(f"Error loading comparison from Redis: {e}")
+    
+    return {field: flask_session.pop(field, None) for field in COMPARISON_FIELDS}
+
 def send_notification_email(user, subject, message):
-    """Send email notification to user"""
+    """Queue email notification to user without blocking the request"""
     if not MAIL_AVAILABLE or not mail:
         print(f"Email not available. Would send to {user.email}: {subject}\n{message}")
         return
     
     if app.config['MAIL_USERNAME'] and app.config['MAIL_PASSWORD']:
+        mail_executor.submit(deliver_email, user.email, subject, message)
+    else:
+        print(f"Email not configured. Would send to {user.email}: {subject}\n{message}")
+
+def deliver_email(recipient, subject, message):
+    """Send an email from the background mail executor"""
+    with app.app_context():
         try:
-            msg = Message(subject, recipients=[user.email])
+            msg = Message(subject, recipients=[recipient])
             msg.body = message
             mail.send(msg)
-            print(f"Email sent to {user.email}: {subject}")
+            print(f"Email sent to {recipient}: {subject}")
         except Exception as e:
             print(f"Error sending email: {e}")
-    else:
-        print(f"Email not configured. Would send to {user.email}: {subject}\n{message}")
 
 def init_db():
     """Initialize the database"""
     with app.app_context():
         db.create_all()
+        
+        # create_all skips indexes on tables that already exist, so add any missing ones
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
         print("Database initialized successfully!")
 
 if __name__ == '__main__':
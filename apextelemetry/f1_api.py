@@ -11,13 +11,276 @@ Version: 1.0.0
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-import random as random_module
+import numpy as np
+from bisect import bisect_left
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from operator import itemgetter
+import hashlib
 import logging
+import sqlite3
+import threading
+import time
+import orjson
+
+# Optional Redis support for sharing API results across workers
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional on-disk cache so API results survive restarts when Redis isn't used
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Errors from either shared cache backend are logged and treated as cache misses
+CACHE_ERRORS = (OSError, sqlite3.Error)
+if REDIS_AVAILABLE:
+    CACHE_ERRORS += (redis.RedisError,)
+if DISKCACHE_AVAILABLE:
+    CACHE_ERRORS += (diskcache.Timeout,)
+
+CACHE_KEY_PREFIX = "f1api"
+REFERENCE_DATA_TTL = 3600  # drivers, seasons, driver race lists (seconds)
+HISTORICAL_RACE_TTL = 86400  # races more than a week old no longer change
+RECENT_RACE_TTL = 60  # race weekend in progress or just finished
+RECENT_RACE_WINDOW_DAYS = 7
+MAX_CONCURRENT_REQUESTS = 8  # parallel Ergast requests when fanning out over seasons
+HTTP_POOL_SIZE = 32  # pooled keep-alive connections to the Ergast host
+API_AVAILABILITY_TTL = 60  # seconds between availability probes
+RESULTS_PAGE_SIZE = 1000  # Ergast's maximum page size
+CIRCUIT_BREAKER_THRESHOLD = 5  # consecutive failed season requests before the API is marked down
+FAILED_REQUEST_TTL = 60  # seconds a URL that errored or returned non-2xx is not retried
+MAX_CACHED_ENTRIES = 256  # per in-process cache; least recently used entries are evicted
+
+# Standard F1 calendar circuits used for fallback races
+SAMPLE_RACES = (
+    {'name': 'Australian Grand Prix', 'circuit': 'Albert Park Grand Prix Circuit', 'location': 'Melbourne', 'country': 'Australia'},
+    {'name': 'Bahrain Grand Prix', 'circuit': 'Bahrain International Circuit', 'location': 'Sakhir', 'country': 'Bahrain'},
+    {'name': 'Chinese Grand Prix', 'circuit': 'Shanghai International Circuit', 'location': 'Shanghai', 'country': 'China'},
+    {'name': 'Spanish Grand Prix', 'circuit': 'Circuit de Barcelona-Catalunya', 'location': 'Montmeló', 'country': 'Spain'},
+    {'name': 'Monaco Grand Prix', 'circuit': 'Circuit de Monaco', 'location': 'Monte-Carlo', 'country': 'Monaco'},
+    {'name': 'Canadian Grand Prix', 'circuit': 'Circuit Gilles Villeneuve', 'location': 'Montreal', 'country': 'Canada'},
+    {'name': 'British Grand Prix', 'circuit': 'Silverstone Circuit', 'location': 'Silverstone', 'country': 'UK'},
+    {'name': 'German Grand Prix', 'circuit': 'Hockenheimring', 'location': 'Hockenheim', 'country': 'Germany'},
+    {'name': 'Hungarian Grand Prix', 'circuit': 'Hungaroring', 'location': 'Budapest', 'country': 'Hungary'},
+    {'name': 'Belgian Grand Prix', 'circuit': 'Circuit de Spa-Francorchamps', 'location': 'Spa', 'country': 'Belgium'},
+    {'name': 'Italian Grand Prix', 'circuit': 'Autodromo Nazionale di Monza', 'location': 'Monza', 'country': 'Italy'},
+    {'name': 'Singapore Grand Prix', 'circuit': 'Marina Bay Street Circuit', 'location': 'Marina Bay', 'country': 'Singapore'},
+    {'name': 'Japanese Grand Prix', 'circuit': 'Suzuka Circuit', 'location': 'Suzuka', 'country': 'Japan'},
+    {'name': 'United States Grand Prix', 'circuit': 'Circuit of the Americas', 'location': 'Austin', 'country': 'USA'},
+    {'name': 'Brazilian Grand Prix', 'circuit': 'Autódromo José Carlos Pace', 'location': 'São Paulo', 'country': 'Brazil'},
+    {'name': 'Abu Dhabi Grand Prix', 'circuit': 'Yas Marina Circuit', 'location': 'Abu Dhabi', 'country': 'UAE'},
+)
+
+# Fallback modern-era drivers (2000-present) for when the Ergast API is unavailable
+DEFAULT_DRIVERS = (
+    # Current drivers (2024)
+    {'id': 'albon', 'name': 'Alexander Albon', 'code': 'ALB', 'nationality': 'Thai'},
+    {'id': 'alonso', 'name': 'Fernando Alonso', 'code': 'ALO', 'nationality': 'Spanish'},
+    {'id': 'bearman', 'name': 'Oliver Bearman', 'code': 'BEA', 'nationality': 'British'},
+    {'id': 'bottas', 'name': 'Valtteri Bottas', 'code': 'BOT', 'nationality': 'Finnish'},
+    {'id': 'gasly', 'name': 'Pierre Gasly', 'code': 'GAS', 'nationality': 'French'},
+    {'id': 'hamilton', 'name': 'Lewis Hamilton', 'code': 'HAM', 'nationality': 'British'},
+    {'id': 'hulkenberg', 'name': 'Nico Hulkenberg', 'code': 'HUL', 'nationality': 'German'},
+    {'id': 'lawson', 'name': 'Liam Lawson', 'code': 'LAW', 'nationality': 'New Zealander'},
+    {'id': 'leclerc', 'name': 'Charles Leclerc', 'code': 'LEC', 'nationality': 'Monegasque'},
+    {'id': 'magnussen', 'name': 'Kevin Magnussen', 'code': 'MAG', 'nationality': 'Danish'},
+    {'id': 'norris', 'name': 'Lando Norris', 'code': 'NOR', 'nationality': 'British'},
+    {'id': 'ocon', 'name': 'Esteban Ocon', 'code': 'OCO', 'nationality': 'French'},
+    {'id': 'perez', 'name': 'Sergio Perez', 'code': 'PER', 'nationality': 'Mexican'},
+    {'id': 'piastri', 'name': 'Oscar Piastri', 'code': 'PIA', 'nationality': 'Australian'},
+    {'id': 'ricciardo', 'name': 'Daniel Ricciardo', 'code': 'RIC', 'nationality': 'Australian'},
+    {'id': 'russell', 'name': 'George Russell', 'code': 'RUS', 'nationality': 'British'},
+    {'id': 'sainz', 'name': 'Carlos Sainz', 'code': 'SAI', 'nationality': 'Spanish'},
+    {'id': 'stroll', 'name': 'Lance Stroll', 'code': 'STR', 'nationality': 'Canadian'},
+    {'id': 'tsunoda', 'name': 'Yuki Tsunoda', 'code': 'TSU', 'nationality': 'Japanese'},
+    {'id': 'verstappen', 'name': 'Max Verstappen', 'code': 'VER', 'nationality': 'Dutch'},
+    {'id': 'zhou', 'name': 'Guanyu Zhou', 'code': 'ZHO', 'nationality': 'Chinese'},
+    # Recent champions and notable drivers (2010-2023)
+    {'id': 'vettel', 'name': 'Sebastian Vettel', 'code': 'VET', 'nationality': 'German'},
+    {'id': 'raikkonen', 'name': 'Kimi Raikkonen', 'code': 'RAI', 'nationality': 'Finnish'},
+    {'id': 'button', 'name': 'Jenson Button', 'code': 'BUT', 'nationality': 'British'},
+    {'id': 'rosberg', 'name': 'Nico Rosberg', 'code': 'ROS', 'nationality': 'German'},
+    {'id': 'massa', 'name': 'Felipe Massa', 'code': 'MAS', 'nationality': 'Brazilian'},
+    {'id': 'webber', 'name': 'Mark Webber', 'code': 'WEB', 'nationality': 'Australian'},
+    {'id': 'kubica', 'name': 'Robert Kubica', 'code': 'KUB', 'nationality': 'Polish'},
+    {'id': 'grosjean', 'name': 'Romain Grosjean', 'code': 'GRO', 'nationality': 'French'},
+    # 2000s era legends
+    {'id': 'schumacher', 'name': 'Michael Schumacher', 'code': 'MSC', 'nationality': 'German'},
+    {'id': 'barrichello', 'name': 'Rubens Barrichello', 'code': 'BAR', 'nationality': 'Brazilian'},
+    {'id': 'coulthard', 'name': 'David Coulthard', 'code': 'COU', 'nationality': 'British'},
+    {'id': 'hakkinen', 'name': 'Mika Hakkinen', 'code': 'HAK', 'nationality': 'Finnish'},
+    {'id': 'montoya', 'name': 'Juan Pablo Montoya', 'code': 'MON', 'nationality': 'Colombian'},
+)
+
+
+def _race_data_ttl(driver_name, race_date=None):
+    """Return the cache TTL for a race, short while the race weekend is recent."""
+    try:
+        age_days = (datetime.now() - datetime.fromisoformat(race_date)).days
+    except (TypeError, ValueError):
+        return RECENT_RACE_TTL
+    return HISTORICAL_RACE_TTL if age_days > RECENT_RACE_WINDOW_DAYS else RECENT_RACE_TTL
+
+
+def _decode_race_data(data):
+    """Restore the array columns and datetime timestamps of telemetry loaded from the cache."""
+    for field, values in data.items():
+        if field == 'timestamp':
+            data[field] = [datetime.fromisoformat(value) for value in values]
+        else:
+            data[field] = np.asarray(values)
+    return data
+
+
+def as_records(columns):
+    """
+    Convert columnar telemetry into a list of per-lap dictionaries.
+    
+    Only needed by consumers that want one dictionary per lap, such as
+    the comparison templates and saved comparisons.
+    
+    Args:
+        columns (dict): Telemetry as returned by F1APIService.fetch_race_data
+        
+    Returns:
+        list: One dictionary per lap with the same keys as columns
+    """
+    keys = list(columns)
+    values = [column.tolist() if isinstance(column, np.ndarray) else column for column in columns.values()]
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def _cache_key(prefix, *args, **kwargs):
+    """Build the Redis key for a cached F1APIService call."""
+    key_parts = [str(arg) for arg in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())]
+    return ':'.join([CACHE_KEY_PREFIX, prefix] + key_parts)
+
+
+def shared_cached(prefix, ttl, decode=None, memo=None):
+    """
+    Cache an F1APIService method's result in the service's shared cache.
+    
+    Results go to Redis when a client is configured, otherwise to the
+    on-disk cache if one is; with neither the method runs uncached.
+    Methods wrap fallback data in FallbackResult; it is returned unwrapped
+    but never stored, so an API outage is not cached past its end.
+    
+    Args:
+        prefix (str): Key namespace for the method
+        ttl (int or callable): Expiry in seconds, or a function of the call
+                               arguments returning one
+        decode (callable, optional): Post-processing applied to cache hits
+        memo (str, optional): Instance attribute holding the in-process result
+                              of argument-less calls. It is returned before the
+                              shared cache is read and is filled from its hits,
+                              so repeated calls get the same object back.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            use_memo = memo is not None and not args and not kwargs
+            if use_memo and getattr(self, memo):
+                return getattr(self, memo)
+            
+            if self.redis is None and self.disk is None:
+                result = method(self, *args, **kwargs)
+                return result.value if isinstance(result, FallbackResult) else result
+            
+            key = _cache_key(prefix, *args, **kwargs)
+            cached = self._shared_cache_get(key)
+            if cached is not None:
+                result = orjson.loads(cached)
+                if decode:
+                    result = decode(result)
+                if use_memo:
+                    setattr(self, memo, result)
+                return result
+            
+            result = method(self, *args, **kwargs)
+            if isinstance(result, FallbackResult):
+                return result.value
+            if result:
+                expiry = ttl(*args, **kwargs) if callable(ttl) else ttl
+                self._shared_cache_set(key, expiry, orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+            return result
+        return wrapper
+    return decorator
+
+
+class RecentlyFailedError(requests.RequestException):
+    """Raised instead of re-requesting a URL that failed within FAILED_REQUEST_TTL."""
+
+
+class FallbackResult:
+    """Marks a shared_cached method's return value as fallback data that must not be cached."""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        self.value = value
+
+
+class ConditionalGetAdapter(HTTPAdapter):
+    """
+    HTTP adapter that revalidates repeated GET requests with ETag/Last-Modified.
+    
+    Bodies of responses carrying a validator are kept in a bounded LRU. When
+    the server answers 304 Not Modified, the stored body is replayed as a 200
+    response, so unchanged seasons are not downloaded again.
+    """
+    
+    def __init__(self, *args, max_entries=MAX_CACHED_ENTRIES, **kwargs):
+        self.max_entries = max_entries
+        self.validated = OrderedDict()  # url -> (etag, last_modified, content)
+        self.validated_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+        
+        with self.validated_lock:
+            cached = self.validated.get(request.url)
+            if cached:
+                self.validated.move_to_end(request.url)
+        
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request.headers['If-None-Match'] = etag
+            if last_modified:
+                request.headers['If-Modified-Since'] = last_modified
+        
+        response = super().send(request, **kwargs)
+        
+        if response.status_code == 304 and cached:
+            response.status_code = 200
+            response._content = cached[2]
+        elif response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                entry = (etag, last_modified, response.content)
+                with self.validated_lock:
+                    self.validated[request.url] = entry
+                    self.validated.move_to_end(request.url)
+                    if len(self.validated) > self.max_entries:
+                        self.validated.popitem(last=False)
+        
+        return response
+
 
 class F1APIService:
     """
@@ -29,19 +292,211 @@ class F1APIService:
     Attributes:
         BASE_URL (str): Base URL for Ergast F1 API
         drivers_cache (list): Cached list of drivers
-        races_cache (dict): Cached race data by year
-        driver_races_cache (dict): Cached races per driver
+        races_cache (OrderedDict): LRU cache of race data by year
+        driver_races_cache (OrderedDict): LRU cache of races per driver ID
+        race_calendars (OrderedDict): LRU cache of date-sorted races and parsed dates by year
+        driver_name_index (dict): Lowercase driver name to driver ID
+        session (requests.Session): Pooled keep-alive HTTP session for Ergast requests
+        inflight (dict): URL to Future for Ergast requests currently in progress
+        failed_urls (OrderedDict): URL to monotonic time of its last failed request
+        redis (Redis or None): Shared response cache, if configured
+        disk (diskcache.Cache or None): On-disk response cache, used when Redis isn't
     """
     
     BASE_URL = "https://ergast.com/api/f1"
     
-    def __init__(self):
-        """Initialize the F1 API service with empty caches."""
+    def __init__(self, redis_url=None, cache_dir=None):
+        """
+        Initialize the F1 API service with empty caches.
+        
+        Args:
+            redis_url (str, optional): Redis URL for the shared response cache.
+                                       Caching is disabled if unset or redis is not installed.
+            cache_dir (str, optional): Directory for an on-disk response cache, used
+                                       when Redis is not configured (requires diskcache).
+        """
         self.drivers_cache = []
-        self.races_cache = {}
-        self.driver_races_cache = {}
+        self.races_cache = OrderedDict()
+        self.driver_races_cache = OrderedDict()
+        self.race_calendars = OrderedDict()
+        self.driver_name_index = {}
+        self.indexed_drivers = None  # driver list driver_name_index was built from
+        self.session = self._create_http_session()
+        self.inflight = {}
+        self.failed_urls = OrderedDict()
+        self.inflight_lock = threading.Lock()
+        self.api_status = None  # (checked_at, available) from the last availability probe
+        self.consecutive_failures = 0
+        self.failures_lock = threading.Lock()
+        self.redis = None
+        self.disk = None
+        
+        if redis_url and REDIS_AVAILABLE:
+            self.redis = redis.Redis.from_url(redis_url)
+            logger.info("F1 API Redis cache enabled")
+        elif redis_url:
+            logger.warning("REDIS_URL is set but redis is not installed; response caching disabled")
+        
+        if cache_dir and self.redis is None:
+            if DISKCACHE_AVAILABLE:
+                self.disk = diskcache.Cache(cache_dir)
+                logger.info(f"F1 API disk cache enabled at {cache_dir}")
+            else:
+                logger.warning("F1_CACHE_DIR is set but diskcache is not installed; disk caching disabled")
+        
         logger.info("F1 API Service initialized")
     
+    @staticmethod
+    def _create_http_session():
+        """
+        Create a requests session that reuses connections to the Ergast API.
+        
+        Rate-limit and server-error responses are retried with backoff;
+        connection failures are not, so an unreachable API fails fast.
+        Repeated requests are sent as conditional GETs.
+        
+        Returns:
+            requests.Session: Session with a pooled, revalidating HTTPS adapter
+        """
+        retry = Retry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = ConditionalGetAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    @staticmethod
+    def _cache_put(cache, key, value):
+        """
+        Store a value in an LRU cache, evicting the oldest entry when full.
+        
+        Args:
+            cache (OrderedDict): Cache ordered from least to most recently used
+            key (str): Cache key
+            value: Value to store
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > MAX_CACHED_ENTRIES:
+            cache.popitem(last=False)
+    
+    def _shared_cache_get(self, key):
+        """
+        Read a serialized API result from Redis or the disk cache.
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            bytes or None: Cached payload, or None on a miss or cache error
+        """
+        try:
+            if self.redis is not None:
+                return self.redis.get(key)
+            if self.disk is not None:
+                return self.disk.get(key)
+        except CACHE_ERRORS as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+    
+    def _shared_cache_set(self, key, expiry, payload):
+        """
+        Write a serialized API result to Redis or the disk cache.
+        
+        Args:
+            key (str): Cache key
+            expiry (int): Time to live in seconds
+            payload (bytes): orjson-encoded result
+        """
+        try:
+            if self.redis is not None:
+                self.redis.setex(key, expiry, payload)
+            elif self.disk is not None:
+                self.disk.set(key, payload, expire=expiry)
+        except CACHE_ERRORS as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+    
+    def _get(self, url, timeout=10):
+        """
+        GET an Ergast URL, sharing one request between concurrent identical calls.
+        
+        The first caller performs the request; callers asking for the same URL
+        while it is in progress wait for and receive the same response (or
+        exception) instead of issuing their own. URLs that raised or returned
+        a non-2xx status are not requested again for FAILED_REQUEST_TTL seconds.
+        
+        Args:
+            url (str): Ergast API URL
+            timeout (int): Request timeout in seconds
+            
+        Returns:
+            requests.Response: Response with its body already read
+            
+        Raises:
+            RecentlyFailedError: If the URL failed within FAILED_REQUEST_TTL
+        """
+        with self.inflight_lock:
+            failed_at = self.failed_urls.get(url)
+            if failed_at is not None and time.monotonic() - failed_at < FAILED_REQUEST_TTL:
+                raise RecentlyFailedError(f"Skipping recently failed request: {url}")
+            
+            future = self.inflight.get(url)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.inflight[url] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        succeeded = False
+        try:
+            response = self.session.get(url, timeout=timeout)
+            succeeded = response.ok
+            future.set_result(response)
+            return response
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.inflight_lock:
+                del self.inflight[url]
+                if succeeded:
+                    self.failed_urls.pop(url, None)
+                else:
+                    self._cache_put(self.failed_urls, url, time.monotonic())
+    
+    def clear_cache(self):
+        """Drop all in-process caches and any Redis- or disk-cached API responses."""
+        self.drivers_cache = []
+        self.races_cache.clear()
+        self.driver_races_cache.clear()
+        self.race_calendars.clear()
+        self.failed_urls.clear()
+        self.api_status = None
+        
+        if self.redis is not None:
+            try:
+                keys = list(self.redis.scan_iter(f"{CACHE_KEY_PREFIX}:*"))
+                if keys:
+                    self.redis.delete(*keys)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to clear Redis cache: {e}")
+        
+        if self.disk is not None:
+            try:
+                self.disk.clear()
+            except CACHE_ERRORS as e:
+                logger.warning(f"Failed to clear disk cache: {e}")
+    
+    @shared_cached('drivers', REFERENCE_DATA_TTL, memo='drivers_cache')
     def get_drivers(self, year=None):
         """
         Get list of F1 drivers from 2000 to present (modern era).
@@ -61,6 +516,10 @@ class F1APIService:
                 - nationality (str): Driver nationality
                 - dateOfBirth (str): Birth date if available
         """
+        # The all-seasons roster is built once per process
+        if self.drivers_cache:
+            return self.drivers_cache
+        
         try:
             drivers_dict = OrderedDict()
             current_year = datetime.now().year
@@ -69,36 +528,34 @@ class F1APIService:
             api_available = self._check_api_availability()
             
             if api_available:
-                # Fetch drivers from each year from 2000 to current year
-                for year in range(2000, current_year + 1):
-                    try:
-                        url = f"{self.BASE_URL}/{year}/drivers.json?limit=100"
-                        response = requests.get(url, timeout=10)
+                # Fetch drivers from each year from 2000 to current year concurrently
+                with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                    season_drivers = list(executor.map(self._fetch_season_drivers, range(2000, current_year + 1)))
+                
+                # Process unique drivers in season order
+                for drivers_list in season_drivers:
+                    for driver in drivers_list or ():
+                        driver_id = driver.get('driverId')
+                        driver_name = f"{driver.get('givenName', '')} {driver.get('familyName', '')}".strip()
                         
-                        if response.status_code == 200:
-                            data = response.json()
-                            drivers_list = data.get('MRData', {}).get('DriverTable', {}).get('Drivers', [])
-                            
-                            # Process unique drivers
-                            for driver in drivers_list:
-                                driver_id = driver.get('driverId')
-                                driver_name = f"{driver.get('givenName', '')} {driver.get('familyName', '')}".strip()
-                                
-                                if driver_id and driver_id not in drivers_dict:
-                                    drivers_dict[driver_id] = {
-                                        'id': driver_id,
-                                        'name': driver_name,
-                                        'code': driver.get('code', ''),
-                                        'nationality': driver.get('nationality', ''),
-                                        'dateOfBirth': driver.get('dateOfBirth', '')
-                                    }
-                    except requests.RequestException as e:
-                        logger.debug(f"Failed to fetch drivers for year {year}: {e}")
-                        continue
+                        if driver_id and driver_id not in drivers_dict:
+                            drivers_dict[driver_id] = {
+                                'id': driver_id,
+                                'name': driver_name,
+                                'code': driver.get('code', ''),
+                                'nationality': driver.get('nationality', ''),
+                                'dateOfBirth': driver.get('dateOfBirth', '')
+                            }
                     
                 if drivers_dict:
                     # Convert to sorted list
-                    drivers = sorted(drivers_dict.values(), key=lambda x: x['name'])
+                    drivers = sorted(drivers_dict.values(), key=itemgetter('name'))
+                    
+                    # A roster missing failed or skipped seasons is served but never cached
+                    if None in season_drivers:
+                        logger.warning("Driver roster incomplete; some seasons could not be fetched")
+                        return FallbackResult(drivers)
+                    
                     self.drivers_cache = drivers
                     logger.info(f"Fetched {len(drivers)} unique drivers from API (2000-present)")
                     return drivers
@@ -113,21 +570,122 @@ class F1APIService:
         
         # Fallback to default driver list
         logger.info("Using fallback driver list")
-        return self._get_default_drivers()
+        return FallbackResult(self._get_default_drivers())
+    
+    def _find_driver_id(self, driver_name):
+        """
+        Look up a driver's Ergast ID by full name (case-insensitive).
+        
+        The name index is rebuilt only when get_drivers returns a
+        different driver list than the one it was built from.
+        
+        Args:
+            driver_name (str): Full name of the F1 driver
+            
+        Returns:
+            str or None: Driver ID, or None if no driver matches
+        """
+        drivers = self.get_drivers()
+        if drivers is not self.indexed_drivers:
+            name_index = {}
+            for driver in drivers:
+                name_index.setdefault(driver['name'].lower(), driver['id'])
+            self.driver_name_index = name_index
+            self.indexed_drivers = drivers
+        
+        return self.driver_name_index.get(driver_name.lower())
+    
+    def _fetch_season_drivers(self, year):
+        """
+        Fetch the raw Ergast driver list for a single season.
+        
+        Args:
+            year (int): Season to fetch drivers for
+            
+        Returns:
+            list or None: Ergast driver dictionaries, or None if the request
+                          was skipped by the circuit breaker or failed
+        """
+        if self._circuit_open():
+            return None
+        
+        try:
+            url = f"{self.BASE_URL}/{year}/drivers.json?limit=100"
+            response = self._get(url, timeout=10)
+            self._record_request_result(response.status_code < 500)
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return data.get('MRData', {}).get('DriverTable', {}).get('Drivers', [])
+        except requests.RequestException as e:
+            self._record_request_result(False)
+            logger.debug(f"Failed to fetch drivers for year {year}: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.debug(f"Failed to fetch drivers for year {year}: {e}")
+        
+        return None
     
     def _check_api_availability(self):
         """
         Check if Ergast API is available.
         
+        The probe result is reused for API_AVAILABILITY_TTL seconds so
+        repeated lookups don't each pay a round-trip.
+        
         Returns:
             bool: True if API is reachable, False otherwise
         """
+        now = time.monotonic()
+        if self.api_status and now - self.api_status[0] < API_AVAILABILITY_TTL:
+            return self.api_status[1]
+        
         try:
             test_url = f"{self.BASE_URL}/2000/drivers.json?limit=1"
-            test_response = requests.get(test_url, timeout=5)
-            return test_response.status_code == 200
+            test_response = self._get(test_url, timeout=5)
+            available = test_response.status_code == 200
         except requests.RequestException:
-            return False
+            available = False
+        
+        self.api_status = (now, available)
+        return available
+    
+    def _circuit_open(self):
+        """
+        Check whether the API is currently marked unavailable.
+        
+        Returns:
+            bool: True if requests should be skipped until the status expires
+        """
+        status = self.api_status
+        return bool(status) and not status[1] and time.monotonic() - status[0] < API_AVAILABILITY_TTL
+    
+    def _record_request_result(self, succeeded):
+        """
+        Track consecutive request failures and trip the circuit breaker.
+        
+        After CIRCUIT_BREAKER_THRESHOLD failures in a row the API is marked
+        unavailable for API_AVAILABILITY_TTL seconds, so the remaining
+        season requests fall back immediately instead of each timing out.
+        
+        Args:
+            succeeded (bool): Whether the request got a usable response
+        """
+        with self.failures_lock:
+            if succeeded:
+                self.consecutive_failures = 0
+                return
+            
+            # Requests already in flight when the breaker tripped don't trip it again
+            if self._circuit_open():
+                return
+            
+            self.consecutive_failures += 1
+            if self.consecutive_failures < CIRCUIT_BREAKER_THRESHOLD:
+                return
+            self.consecutive_failures = 0
+        
+        logger.warning(f"Ergast API failing repeatedly; skipping requests for {API_AVAILABILITY_TTL}s")
+        self.api_status = (time.monotonic(), False)
     
     def _get_default_drivers(self):
         """
@@ -137,48 +695,10 @@ class F1APIService:
         Includes drivers from 2000s era through current 2024 season.
         
         Returns:
-            list: List of driver dictionaries with id, name, code, nationality
-        """
-        return [
-            # Current drivers (2024)
-            {'id': 'albon', 'name': 'Alexander Albon', 'code': 'ALB', 'nationality': 'Thai'},
-            {'id': 'alonso', 'name': 'Fernando Alonso', 'code': 'ALO', 'nationality': 'Spanish'},
-            {'id': 'bearman', 'name': 'Oliver Bearman', 'code': 'BEA', 'nationality': 'British'},
-            {'id': 'bottas', 'name': 'Valtteri Bottas', 'code': 'BOT', 'nationality': 'Finnish'},
-            {'id': 'gasly', 'name': 'Pierre Gasly', 'code': 'GAS', 'nationality': 'French'},
-            {'id': 'hamilton', 'name': 'Lewis Hamilton', 'code': 'HAM', 'nationality': 'British'},
-            {'id': 'hulkenberg', 'name': 'Nico Hulkenberg', 'code': 'HUL', 'nationality': 'German'},
-            {'id': 'lawson', 'name': 'Liam Lawson', 'code': 'LAW', 'nationality': 'New Zealander'},
-            {'id': 'leclerc', 'name': 'Charles Leclerc', 'code': 'LEC', 'nationality': 'Monegasque'},
-            {'id': 'magnussen', 'name': 'Kevin Magnussen', 'code': 'MAG', 'nationality': 'Danish'},
-            {'id': 'norris', 'name': 'Lando Norris', 'code': 'NOR', 'nationality': 'British'},
-            {'id': 'ocon', 'name': 'Esteban Ocon', 'code': 'OCO', 'nationality': 'French'},
-            {'id': 'perez', 'name': 'Sergio Perez', 'code': 'PER', 'nationality': 'Mexican'},
-            {'id': 'piastri', 'name': 'Oscar Piastri', 'code': 'PIA', 'nationality': 'Australian'},
-            {'id': 'ricciardo', 'name': 'Daniel Ricciardo', 'code': 'RIC', 'nationality': 'Australian'},
-            {'id': 'russell', 'name': 'George Russell', 'code': 'RUS', 'nationality': 'British'},
-            {'id': 'sainz', 'name': 'Carlos Sainz', 'code': 'SAI', 'nationality': 'Spanish'},
-            {'id': 'stroll', 'name': 'Lance Stroll', 'code': 'STR', 'nationality': 'Canadian'},
-            {'id': 'tsunoda', 'name': 'Yuki Tsunoda', 'code': 'TSU', 'nationality': 'Japanese'},
-            {'id': 'verstappen', 'name': 'Max Verstappen', 'code': 'VER', 'nationality': 'Dutch'},
-            {'id': 'zhou', 'name': 'Guanyu Zhou', 'code': 'ZHO', 'nationality': 'Chinese'},
-            # Recent champions and notable drivers (2010-2023)
-            {'id': 'vettel', 'name': 'Sebastian Vettel', 'code': 'VET', 'nationality': 'German'},
-            {'id': 'raikkonen', 'name': 'Kimi Raikkonen', 'code': 'RAI', 'nationality': 'Finnish'},
-            {'id': 'button', 'name': 'Jenson Button', 'code': 'BUT', 'nationality': 'British'},
-            {'id': 'rosberg', 'name': 'Nico Rosberg', 'code': 'ROS', 'nationality': 'German'},
-            {'id': 'massa', 'name': 'Felipe Massa', 'code': 'MAS', 'nationality': 'Brazilian'},
-            {'id': 'webber', 'name': 'Mark Webber', 'code': 'WEB', 'nationality': 'Australian'},
-            {'id': 'kubica', 'name': 'Robert Kubica', 'code': 'KUB', 'nationality': 'Polish'},
-            {'id': 'grosjean', 'name': 'Romain Grosjean', 'code': 'GRO', 'nationality': 'French'},
-            # 2000s era legends
-            {'id': 'schumacher', 'name': 'Michael Schumacher', 'code': 'MSC', 'nationality': 'German'},
-            {'id': 'barrichello', 'name': 'Rubens Barrichello', 'code': 'BAR', 'nationality': 'Brazilian'},
-            {'id': 'coulthard', 'name': 'David Coulthard', 'code': 'COU', 'nationality': 'British'},
-            {'id': 'hakkinen', 'name': 'Mika Hakkinen', 'code': 'HAK', 'nationality': 'Finnish'},
-            {'id': 'montoya', 'name': 'Juan Pablo Montoya', 'code': 'MON', 'nationality': 'Colombian'},
-            {'id': 'raikkonen', 'name': 'Kimi Raikkonen', 'code': 'RAI', 'nationality': 'Finnish'},
-        ]
+            tuple: Shared driver dictionaries with id, name, code, nationality
+                   (built once at import; callers must not modify them)
+        """
+        return DEFAULT_DRIVERS
     
     def get_races_by_year(self, year):
         """
@@ -192,22 +712,52 @@ class F1APIService:
         """
         cache_key = f"races_{year}"
         if cache_key in self.races_cache:
+            self.races_cache.move_to_end(cache_key)
             return self.races_cache[cache_key]
         
         try:
             url = f"{self.BASE_URL}/{year}.json?limit=100"
-            response = requests.get(url, timeout=10)
+            response = self._get(url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 races = data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
-                self.races_cache[cache_key] = races
+                self._cache_put(self.races_cache, cache_key, races)
                 logger.debug(f"Fetched {len(races)} races for year {year}")
                 return races
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching races for year {year}: {e}")
         
         return []
     
+    def _get_race_calendar(self, year):
+        """
+        Get a season's races in date order along with their parsed dates.
+        
+        Args:
+            year (int): Season to get races for
+            
+        Returns:
+            tuple: (dates, races) lists aligned by index; races without a valid
+                   date are left out
+        """
+        if year in self.race_calendars:
+            self.race_calendars.move_to_end(year)
+            return self.race_calendars[year]
+        
+        dated_races = []
+        for race in self.get_races_by_year(year):
+            try:
+                dated_races.append((datetime.fromisoformat(race.get('date', '')), race))
+            except (TypeError, ValueError):
+                continue
+        dated_races.sort(key=itemgetter(0))
+        
+        calendar = ([race_date for race_date, _ in dated_races], [race for _, race in dated_races])
+        if dated_races:
+            self._cache_put(self.race_calendars, year, calendar)
+        return calendar
+    
+    @shared_cached('years', REFERENCE_DATA_TTL)
     def get_available_years(self):
         """
         Get list of all available years with race data.
@@ -217,19 +767,19 @@ class F1APIService:
         """
         try:
             url = f"{self.BASE_URL}/seasons.json?limit=100"
-            response = requests.get(url, timeout=10)
+            response = self._get(url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 seasons = data.get('MRData', {}).get('SeasonTable', {}).get('Seasons', [])
                 years = [int(season.get('season', 0)) for season in seasons if season.get('season')]
                 logger.debug(f"Fetched {len(years)} available years")
                 return sorted(years, reverse=True)
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching available years: {e}")
         
         # Fallback: return recent years
         current_year = datetime.now().year
-        return list(range(current_year, 1999, -1))  # 2000-present, reversed
+        return FallbackResult(list(range(current_year, 1999, -1)))  # 2000-present, reversed
     
     def get_races_for_driver(self, driver_name):
         """
@@ -237,7 +787,9 @@ class F1APIService:
         
         Fetches actual race participation data from API when available.
         Falls back to generating consistent sample races for all drivers
-        to ensure comparisons work properly.
+        to ensure comparisons work properly. Results are cached in process
+        and in the shared cache under the driver's Ergast ID, so every
+        spelling of a name shares one entry.
         
         Args:
             driver_name (str): Full name of the F1 driver
@@ -245,83 +797,106 @@ class F1APIService:
         Returns:
             list: List of race dictionaries with year, round, name, date, circuit info
         """
-        cache_key = f"driver_races_{driver_name}"
-        if cache_key in self.driver_races_cache:
-            return self.driver_races_cache[cache_key]
-        
-        races_list = []
-        current_year = datetime.now().year
-        
         # Find driver ID
-        driver_id = None
-        drivers = self.get_drivers()
-        for driver in drivers:
-            if driver['name'].lower() == driver_name.lower():
-                driver_id = driver['id']
-                break
+        driver_id = self._find_driver_id(driver_name)
         
         if not driver_id:
             logger.warning(f"Driver not found: {driver_name}")
             return []
         
+        # Keyed by ID so any capitalization of the name shares one entry
+        cache_key = f"driver_races_{driver_id}"
+        if cache_key in self.driver_races_cache:
+            self.driver_races_cache.move_to_end(cache_key)
+            return self.driver_races_cache[cache_key]
+        
+        shared_key = _cache_key('driver_races', driver_id)
+        cached = self._shared_cache_get(shared_key)
+        if cached is not None:
+            races_list = orjson.loads(cached)
+            self._cache_put(self.driver_races_cache, cache_key, races_list)
+            return races_list
+        
+        races_list = []
+        
         # Check API availability
         api_available = self._check_api_availability()
         
         if api_available:
-            # Fetch actual races for the driver
-            for year in range(2000, current_year + 1):
-                try:
-                    url = f"{self.BASE_URL}/{year}.json?limit=100"
-                    response = requests.get(url, timeout=10)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        races = data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
-                        
-                        # Check driver participation in each race
-                        for race in races:
-                            round_num = race.get('round')
-                            race_name = race.get('raceName', '')
-                            race_date = race.get('date', '')
-                            
-                            # Verify driver results for this race
-                            try:
-                                results_url = f"{self.BASE_URL}/{year}/{round_num}/results.json"
-                                results_response = requests.get(results_url, timeout=10)
-                                if results_response.status_code == 200:
-                                    results_data = results_response.json()
-                                    results = results_data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
-                                    if results:
-                                        race_results = results[0].get('Results', [])
-                                        for result in race_results:
-                                            if result.get('Driver', {}).get('driverId') == driver_id:
-                                                races_list.append({
-                                                    'year': year,
-                                                    'round': int(round_num),
-                                                    'name': race_name,
-                                                    'date': race_date,
-                                                    'circuit': race.get('Circuit', {}).get('circuitName', ''),
-                                                    'location': race.get('Circuit', {}).get('Location', {}).get('locality', ''),
-                                                    'country': race.get('Circuit', {}).get('Location', {}).get('country', ''),
-                                                    'display_name': f"{race_name} {year} ({race_date})"
-                                                })
-                                                break
-                            except requests.RequestException:
-                                continue
-                except requests.RequestException:
-                    continue
+            races_list = self._fetch_driver_career_races(driver_id)
         
         # If no races found, generate fallback races
         # CRITICAL: Same races for ALL drivers to enable comparisons
-        if not races_list:
+        use_fallback = not races_list
+        if use_fallback:
             races_list = self._generate_fallback_races()
         
         # Sort by date (most recent first)
-        races_list.sort(key=lambda x: (x['year'], x['round']), reverse=True)
-        self.driver_races_cache[cache_key] = races_list
+        races_list.sort(key=itemgetter('year', 'round'), reverse=True)
+        
+        # Fallback races are not cached, so real data is fetched once the API recovers
+        if use_fallback:
+            return races_list
+        self._cache_put(self.driver_races_cache, cache_key, races_list)
+        self._shared_cache_set(shared_key, REFERENCE_DATA_TTL, orjson.dumps(races_list))
         logger.debug(f"Found {len(races_list)} races for driver {driver_name}")
         return races_list
     
+    def _fetch_driver_career_races(self, driver_id):
+        """
+        Get the races a driver took part in from 2000 onwards.
+        
+        The whole career comes from the per-driver results endpoint, a page
+        of RESULTS_PAGE_SIZE results at a time (one page for any modern driver).
+        
+        Args:
+            driver_id (str): Ergast driver ID
+            
+        Returns:
+            list: Race dictionaries with year, round, name, date, circuit info
+        """
+        races_list = []
+        offset = 0
+        
+        while not self._circuit_open():
+            try:
+                url = f"{self.BASE_URL}/drivers/{driver_id}/results.json?limit={RESULTS_PAGE_SIZE}&offset={offset}"
+                response = self._get(url, timeout=10)
+                self._record_request_result(response.status_code < 500)
+                if response.status_code != 200:
+                    break
+                data = orjson.loads(response.content).get('MRData', {})
+            except requests.RequestException:
+                self._record_request_result(False)
+                break
+            except orjson.JSONDecodeError:
+                break
+            
+            races = data.get('RaceTable', {}).get('Races', [])
+            for race in races:
+                year = int(race.get('season', 0))
+                if year < 2000:
+                    continue
+                
+                race_name = race.get('raceName', '')
+                race_date = race.get('date', '')
+                races_list.append({
+                    'year': year,
+                    'round': int(race.get('round')),
+                    'name': race_name,
+                    'date': race_date,
+                    'circuit': race.get('Circuit', {}).get('circuitName', ''),
+                    'location': race.get('Circuit', {}).get('Location', {}).get('locality', ''),
+                    'country': race.get('Circuit', {}).get('Location', {}).get('country', ''),
+                    'display_name': f"{race_name} {year} ({race_date})"
+                })
+            
+            offset += RESULTS_PAGE_SIZE
+            if not races or offset >= int(data.get('total', 0)):
+                break
+        
+        return races_list
+    
     def _generate_fallback_races(self):
         """
         Generate consistent fallback races for all drivers.
@@ -332,32 +907,25 @@ class F1APIService:
         Returns:
             list: List of race dictionaries with consistent dates
         """
-        races_list = []
-        current_year = datetime.now().year
+        return [dict(race) for race in self._fallback_races_for(datetime.now().year)]
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _fallback_races_for(current_year):
+        """
+        Build the fallback race calendar for the seasons up to current_year.
         
-        # Standard F1 calendar circuits
-        sample_races = [
-            {'name': 'Australian Grand Prix', 'circuit': 'Albert Park Grand Prix Circuit', 'location': 'Melbourne', 'country': 'Australia'},
-            {'name': 'Bahrain Grand Prix', 'circuit': 'Bahrain International Circuit', 'location': 'Sakhir', 'country': 'Bahrain'},
-            {'name': 'Chinese Grand Prix', 'circuit': 'Shanghai International Circuit', 'location': 'Shanghai', 'country': 'China'},
-            {'name': 'Spanish Grand Prix', 'circuit': 'Circuit de Barcelona-Catalunya', 'location': 'Montmeló', 'country': 'Spain'},
-            {'name': 'Monaco Grand Prix', 'circuit': 'Circuit de Monaco', 'location': 'Monte-Carlo', 'country': 'Monaco'},
-            {'name': 'Canadian Grand Prix', 'circuit': 'Circuit Gilles Villeneuve', 'location': 'Montreal', 'country': 'Canada'},
-            {'name': 'British Grand Prix', 'circuit': 'Silverstone Circuit', 'location': 'Silverstone', 'country': 'UK'},
-            {'name': 'German Grand Prix', 'circuit': 'Hockenheimring', 'location': 'Hockenheim', 'country': 'Germany'},
-            {'name': 'Hungarian Grand Prix', 'circuit': 'Hungaroring', 'location': 'Budapest', 'country': 'Hungary'},
-            {'name': 'Belgian Grand Prix', 'circuit': 'Circuit de Spa-Francorchamps', 'location': 'Spa', 'country': 'Belgium'},
-            {'name': 'Italian Grand Prix', 'circuit': 'Autodromo Nazionale di Monza', 'location': 'Monza', 'country': 'Italy'},
-            {'name': 'Singapore Grand Prix', 'circuit': 'Marina Bay Street Circuit', 'location': 'Marina Bay', 'country': 'Singapore'},
-            {'name': 'Japanese Grand Prix', 'circuit': 'Suzuka Circuit', 'location': 'Suzuka', 'country': 'Japan'},
-            {'name': 'United States Grand Prix', 'circuit': 'Circuit of the Americas', 'location': 'Austin', 'country': 'USA'},
-            {'name': 'Brazilian Grand Prix', 'circuit': 'Autódromo José Carlos Pace', 'location': 'São Paulo', 'country': 'Brazil'},
-            {'name': 'Abu Dhabi Grand Prix', 'circuit': 'Yas Marina Circuit', 'location': 'Abu Dhabi', 'country': 'UAE'},
-        ]
+        Args:
+            current_year (int): Most recent season to include
+            
+        Returns:
+            tuple: Race dictionaries with consistent dates
+        """
+        races_list = []
         
         # Generate races for recent years with consistent dates
         for year in range(max(2020, current_year - 4), current_year + 1):
-            for round_num, race_template in enumerate(sample_races[:12], 1):
+            for round_num, race_template in enumerate(SAMPLE_RACES[:12], 1):
                 # Calculate consistent date: March through October
                 base_month = 3
                 month = min(10, base_month + ((round_num - 1) // 2))
@@ -382,7 +950,7 @@ class F1APIService:
                     'display_name': f"{race_template['name']} {year} ({race_date})"
                 })
         
-        return races_list
+        return tuple(races_list)
     
     def get_race_results(self, year, round_num=None, driver_id=None):
         """
@@ -402,9 +970,9 @@ class F1APIService:
             else:
                 url = f"{self.BASE_URL}/{year}/results.json?limit=100"
             
-            response = requests.get(url, timeout=10)
+            response = self._get(url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 races = data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
                 
                 if driver_id and races:
@@ -419,11 +987,12 @@ class F1APIService:
                                 }
                 
                 return races
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching race results: {e}")
         
         return None
     
+    @shared_cached('race_telemetry', _race_data_ttl, decode=_decode_race_data)
     def fetch_race_data(self, driver_name, race_date=None):
         """
         Fetch race telemetry data for a driver using historical race data.
@@ -436,52 +1005,34 @@ class F1APIService:
             race_date (str, optional): Race date in YYYY-MM-DD format
             
         Returns:
-            list: List of telemetry data points with timestamps
+            dict: Columnar telemetry, one array per metric (see _generate_enhanced_data)
         """
         try:
-            year = None
             race_results = None
             
-            # Parse race date to get year
+            # Parse race date once; it gives both the year and the closest-race target
+            target_date = datetime.now()
             if race_date:
                 try:
-                    date_obj = datetime.strptime(race_date, '%Y-%m-%d')
-                    year = date_obj.year
+                    target_date = datetime.fromisoformat(race_date)
                 except ValueError as e:
                     logger.error(f"Invalid date format: {race_date}, {e}")
-                    year = datetime.now().year
-            else:
-                year = datetime.now().year
+            year = target_date.year
             
             # Find driver ID
-            driver_id = None
-            drivers = self.get_drivers()
-            for driver in drivers:
-                if driver['name'].lower() == driver_name.lower():
-                    driver_id = driver['id']
-                    break
+            driver_id = self._find_driver_id(driver_name)
             
             # Try to fetch actual race results
             if driver_id and year:
-                races = self.get_races_by_year(year)
+                race_dates, races = self._get_race_calendar(year)
                 
-                # Find closest race to specified date
-                target_date = datetime.strptime(race_date, '%Y-%m-%d') if race_date else datetime.now()
+                # Find closest race to specified date: the first race on or after it, or the one before
                 closest_race = None
-                min_date_diff = None
-                
-                for race in races:
-                    try:
-                        race_date_str = race.get('date', '')
-                        if race_date_str:
-                            race_date_obj = datetime.strptime(race_date_str, '%Y-%m-%d')
-                            date_diff = abs((target_date - race_date_obj).days)
-                            
-                            if min_date_diff is None or date_diff < min_date_diff:
-                                min_date_diff = date_diff
-                                closest_race = race
-                    except ValueError:
-                        continue
+                if race_dates:
+                    index = bisect_left(race_dates, target_date)
+                    candidates = range(max(0, index - 1), min(index + 1, len(race_dates)))
+                    closest = min(candidates, key=lambda i: abs((target_date - race_dates[i]).days))
+                    closest_race = races[closest]
                 
                 # Get race results for the driver
                 if closest_race:
@@ -490,11 +1041,72 @@ class F1APIService:
                     logger.debug(f"Found race results for {driver_name} in {year}")
             
             # Generate telemetry data
-            return self._generate_enhanced_data(driver_name, race_results, year, race_date)
+            data = self._generate_enhanced_data(driver_name, race_results, year, race_date)
+            
+            # A known driver without results means the calendar or results lookup failed (or found
+            # nothing yet), so the telemetry is a stand-in that must not be cached
+            if race_results is None and driver_id:
+                return FallbackResult(data)
+            return data
             
         except Exception as e:
             logger.error(f"Error fetching race data: {e}")
-            return self._generate_enhanced_data(driver_name, None, None, race_date)
+            return FallbackResult(self._generate_enhanced_data(driver_name, None, None, race_date))
+    
+    def fetch_race_data_for_drivers(self, driver_names, race_date=None):
+        """
+        Fetch race telemetry data for several drivers concurrently.
+        
+        Each driver's lookup is network-bound, so the fetches run on a
+        thread pool and their HTTP round-trips overlap. When Redis is
+        configured, all cache entries are read with a single MGET and
+        the misses are backfilled in one pipeline.
+        
+        Args:
+            driver_names (list): Full names of the F1 drivers
+            race_date (str, optional): Race date in YYYY-MM-DD format
+            
+        Returns:
+            list: Columnar telemetry dicts in the same order as driver_names
+        """
+        if not driver_names:
+            return []
+        
+        results = [None] * len(driver_names)
+        keys = [_cache_key('race_telemetry', name, race_date) for name in driver_names]
+        
+        if self.redis is not None:
+            try:
+                for i, cached in enumerate(self.redis.mget(keys)):
+                    if cached is not None:
+                        results[i] = _decode_race_data(orjson.loads(cached))
+            except redis.RedisError as e:
+                logger.warning(f"Redis cache read failed for {keys}: {e}")
+        
+        misses = [i for i, data in enumerate(results) if data is None]
+        if not misses:
+            return results
+        
+        # With Redis, bypass the per-call cache wrapper; misses are written back together below
+        fetch = F1APIService.fetch_race_data.__wrapped__ if self.redis is not None else F1APIService.fetch_race_data
+        with ThreadPoolExecutor(max_workers=len(misses)) as executor:
+            fetched = list(executor.map(lambda i: fetch(self, driver_names[i], race_date), misses))
+        
+        for i, data in zip(misses, fetched):
+            results[i] = data.value if isinstance(data, FallbackResult) else data
+        
+        if self.redis is not None:
+            try:
+                pipeline = self.redis.pipeline()
+                expiry = _race_data_ttl(None, race_date)
+                for i, data in zip(misses, fetched):
+                    if data and not isinstance(data, FallbackResult):
+                        pipeline.setex(keys[i], expiry, orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+                pipeline.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Redis cache write failed for {keys}: {e}")
+        
+        return results
     
     def _generate_enhanced_data(self, driver_name, race_result, year, race_date):
         """
@@ -510,15 +1122,16 @@ class F1APIService:
             race_date (str, optional): Race date
             
         Returns:
-            list: List of telemetry dictionaries with speed, RPM, lap times, etc.
+            dict: One entry per metric (speed, rpm, lap_time, tire_temp, tire_wear,
+                  sector_time, position, lap) holding a NumPy array with a value
+                  per lap, plus a list of datetime lap timestamps
         """
-        data_points = []
         base_time = datetime.now()
         
         # Use actual race date if provided
         if race_date:
             try:
-                base_time = datetime.strptime(race_date, '%Y-%m-%d')
+                base_time = datetime.fromisoformat(race_date)
             except ValueError:
                 pass
         
@@ -549,8 +1162,9 @@ class F1APIService:
         
         # Create driver-specific random number generator
         # This ensures consistent data for each driver while avoiding global state pollution
-        driver_hash = hash(driver_name) % 1000
-        rng = random_module.Random(driver_hash)
+        # (a digest rather than hash(), which is salted per process)
+        driver_hash = int.from_bytes(hashlib.blake2s(driver_name.encode('utf-8'), digest_size=4).digest(), 'little') % 1000
+        rng = np.random.default_rng(driver_hash)
         
         # Driver-specific performance modifiers
         performance_modifier = (driver_hash % 20) - 10
@@ -570,53 +1184,55 @@ class F1APIService:
         else:
             base_lap_time = 85 - lap_time_modifier
         
-        # Generate telemetry for each lap
-        for lap in range(1, actual_laps + 1):
-            # Base values with driver-specific variations
-            base_speed = 280 + speed_modifier + rng.uniform(-20, 20)
-            base_rpm = 12000 + rng.uniform(-500, 500)
-            
-            # Tire wear increases progressively
-            tire_wear_rate = 1.8 + (consistency_modifier * 0.1)
-            tire_wear = min(100, (lap / actual_laps) * 100 * tire_wear_rate + rng.uniform(-5, 5))
-            
-            # Tire temperature correlates with wear
-            tire_temp = 90 + (tire_wear * 0.3) + rng.uniform(-5, 5)
-            
-            # Lap time degrades with tire wear
-            lap_time = base_lap_time + (tire_wear * 0.1) + rng.uniform(-2, 2) / consistency_modifier
-            
-            # Sector time (approximately 1/3 of lap)
-            sector_time = lap_time / 3 + rng.uniform(-0.5, 0.5) / consistency_modifier
-            
-            # Position changes slightly over race
-            if actual_position:
-                position = max(1, min(20, actual_position + int(rng.uniform(-1, 1))))
-            else:
-                position_variation = int(rng.uniform(-3, 3) - (performance_modifier / 3))
-                position = max(1, min(20, start_position + position_variation + (lap // 15)))
-            
-            # Speed reduces as tires wear
-            speed = base_speed - (tire_wear * 0.5) + rng.uniform(-10, 10)
-            
-            # RPM correlates with speed
-            rpm = base_rpm + (speed - 280) * 10 + rng.uniform(-200, 200)
-            
-            timestamp = base_time + timedelta(seconds=lap * lap_time)
-            
-            data_points.append({
-                'speed': round(speed, 2),
-                'rpm': round(rpm, 0),
-                'lap_time': round(lap_time, 3),
-                'tire_temp': round(tire_temp, 1),
-                'tire_wear': round(tire_wear, 1),
-                'sector_time': round(sector_time, 3),
-                'position': position,
-                'timestamp': timestamp,
-                'lap': lap
-            })
-        
-        logger.info(f"Generated {len(data_points)} telemetry points for {driver_name}")
-        return data_points
+        # Generate telemetry for all laps at once (one array element per lap)
+        laps = np.arange(1, actual_laps + 1)
+        
+        # Base values with driver-specific variations
+        base_speed = 280 + speed_modifier + rng.uniform(-20, 20, actual_laps)
+        base_rpm = 12000 + rng.uniform(-500, 500, actual_laps)
+        
+        # Tire wear increases progressively
+        tire_wear_rate = 1.8 + (consistency_modifier * 0.1)
+        tire_wear = np.minimum(100, (laps / actual_laps) * 100 * tire_wear_rate + rng.uniform(-5, 5, actual_laps))
+        
+        # Tire temperature correlates with wear
+        tire_temp = 90 + (tire_wear * 0.3) + rng.uniform(-5, 5, actual_laps)
+        
+        # Lap time degrades with tire wear
+        lap_time = base_lap_time + (tire_wear * 0.1) + rng.uniform(-2, 2, actual_laps) / consistency_modifier
+        
+        # Sector time (approximately 1/3 of lap)
+        sector_time = lap_time / 3 + rng.uniform(-0.5, 0.5, actual_laps) / consistency_modifier
+        
+        # Position changes slightly over race (offsets truncate toward zero)
+        if actual_position:
+            position = actual_position + np.trunc(rng.uniform(-1, 1, actual_laps))
+        else:
+            position_variation = np.trunc(rng.uniform(-3, 3, actual_laps) - (performance_modifier / 3))
+            position = start_position + position_variation + (laps // 15)
+        position = np.clip(position, 1, 20).astype(int)
+        
+        # Speed reduces as tires wear
+        speed = base_speed - (tire_wear * 0.5) + rng.uniform(-10, 10, actual_laps)
+        
+        # RPM correlates with speed
+        rpm = base_rpm + (speed - 280) * 10 + rng.uniform(-200, 200, actual_laps)
+        
+        timestamps = [base_time + timedelta(seconds=offset) for offset in (laps * lap_time).tolist()]
+        
+        data_columns = {
+            'speed': np.round(speed, 2),
+            'rpm': np.round(rpm, 0),
+            'lap_time': np.round(lap_time, 3),
+            'tire_temp': np.round(tire_temp, 1),
+            'tire_wear': np.round(tire_wear, 1),
+            'sector_time': np.round(sector_time, 3),
+            'position': position,
+            'timestamp': timestamps,
+            'lap': laps
+        }
+        
+        logger.info(f"Generated {actual_laps} telemetry points for {driver_name}")
+        return data_columns
     
 
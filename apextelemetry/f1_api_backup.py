@@ -12,12 +12,16 @@ Version: 1.0.0
 
 import requests
 from datetime import datetime, timedelta
-import random as random_module
 from collections import OrderedDict
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Key order of each generated telemetry point
+TELEMETRY_KEYS = ('speed', 'rpm', 'lap_time', 'tire_temp', 'tire_wear', 'sector_time', 'position', 'timestamp', 'lap')
+
 
 class F1APIService:
     """
@@ -512,7 +516,6 @@ class F1APIService:
         Returns:
             list: List of telemetry dictionaries with speed, RPM, lap times, etc.
         """
-        data_points = []
         base_time = datetime.now()
         
         # Use actual race date if provided
@@ -550,7 +553,7 @@ class F1APIService:
         # Create driver-specific random number generator
         # This ensures consistent data for each driver while avoiding global state pollution
         driver_hash = hash(driver_name) % 1000
-        rng = random_module.Random(driver_hash)
+        rng = np.random.default_rng(driver_hash)
         
         # Driver-specific performance modifiers
         performance_modifier = (driver_hash % 20) - 10
@@ -570,51 +573,55 @@ class F1APIService:
         else:
             base_lap_time = 85 - lap_time_modifier
         
-        # Generate telemetry for each lap
-        for lap in range(1, actual_laps + 1):
-            # Base values with driver-specific variations
-            base_speed = 280 + speed_modifier + rng.uniform(-20, 20)
-            base_rpm = 12000 + rng.uniform(-500, 500)
-            
-            # Tire wear increases progressively
-            tire_wear_rate = 1.8 + (consistency_modifier * 0.1)
-            tire_wear = min(100, (lap / actual_laps) * 100 * tire_wear_rate + rng.uniform(-5, 5))
-            
-            # Tire temperature correlates with wear
-            tire_temp = 90 + (tire_wear * 0.3) + rng.uniform(-5, 5)
-            
-            # Lap time degrades with tire wear
-            lap_time = base_lap_time + (tire_wear * 0.1) + rng.uniform(-2, 2) / consistency_modifier
-            
-            # Sector time (approximately 1/3 of lap)
-            sector_time = lap_time / 3 + rng.uniform(-0.5, 0.5) / consistency_modifier
-            
-            # Position changes slightly over race
-            if actual_position:
-                position = max(1, min(20, actual_position + int(rng.uniform(-1, 1))))
-            else:
-                position_variation = int(rng.uniform(-3, 3) - (performance_modifier / 3))
-                position = max(1, min(20, start_position + position_variation + (lap // 15)))
-            
-            # Speed reduces as tires wear
-            speed = base_speed - (tire_wear * 0.5) + rng.uniform(-10, 10)
-            
-            # RPM correlates with speed
-            rpm = base_rpm + (speed - 280) * 10 + rng.uniform(-200, 200)
-            
-            timestamp = base_time + timedelta(seconds=lap * lap_time)
-            
-            data_points.append({
-                'speed': round(speed, 2),
-                'rpm': round(rpm, 0),
-                'lap_time': round(lap_time, 3),
-                'tire_temp': round(tire_temp, 1),
-                'tire_wear': round(tire_wear, 1),
-                'sector_time': round(sector_time, 3),
-                'position': position,
-                'timestamp': timestamp,
-                'lap': lap
-            })
+        # Generate telemetry for all laps at once (one array element per lap)
+        laps = np.arange(1, actual_laps + 1)
+        
+        # Base values with driver-specific variations
+        base_speed = 280 + speed_modifier + rng.uniform(-20, 20, actual_laps)
+        base_rpm = 12000 + rng.uniform(-500, 500, actual_laps)
+        
+        # Tire wear increases progressively
+        tire_wear_rate = 1.8 + (consistency_modifier * 0.1)
+        tire_wear = np.minimum(100, (laps / actual_laps) * 100 * tire_wear_rate + rng.uniform(-5, 5, actual_laps))
+        
+        # Tire temperature correlates with wear
+        tire_temp = 90 + (tire_wear * 0.3) + rng.uniform(-5, 5, actual_laps)
+        
+        # Lap time degrades with tire wear
+        lap_time = base_lap_time + (tire_wear * 0.1) + rng.uniform(-2, 2, actual_laps) / consistency_modifier
+        
+        # Sector time (approximately 1/3 of lap)
+        sector_time = lap_time / 3 + rng.uniform(-0.5, 0.5, actual_laps) / consistency_modifier
+        
+        # Position changes slightly over race (offsets truncate toward zero)
+        if actual_position:
+            position = actual_position + np.trunc(rng.uniform(-1, 1, actual_laps))
+        else:
+            position_variation = np.trunc(rng.uniform(-3, 3, actual_laps) - (performance_modifier / 3))
+            position = start_position + position_variation + (laps // 15)
+        position = np.clip(position, 1, 20).astype(int)
+        
+        # Speed reduces as tires wear
+        speed = base_speed - (tire_wear * 0.5) + rng.uniform(-10, 10, actual_laps)
+        
+        # RPM correlates with speed
+        rpm = base_rpm + (speed - 280) * 10 + rng.uniform(-200, 200, actual_laps)
+        
+        timestamps = [base_time + timedelta(seconds=offset) for offset in (laps * lap_time).tolist()]
+        
+        # Convert to per-lap dictionaries only once all columns are computed
+        columns = (
+            np.round(speed, 2).tolist(),
+            np.round(rpm, 0).tolist(),
+            np.round(lap_time, 3).tolist(),
+            np.round(tire_temp, 1).tolist(),
+            np.round(tire_wear, 1).tolist(),
+            np.round(sector_time, 3).tolist(),
+            position.tolist(),
+            timestamps,
+            laps.tolist(),
+        )
+        data_points = [dict(zip(TELEMETRY_KEYS, row)) for row in zip(*columns)]
         
         logger.info(f"Generated {len(data_points)} telemetry points for {driver_name}")
         return data_points
@@ -1024,7 +1031,6 @@ class F1APIService:
         """
         Generate telemetry data enhanced with actual race results when available
         """
-        data_points = []
         base_time = datetime.now()
         
         # If we have actual race date, use it
@@ -1057,7 +1063,7 @@ class F1APIService:
         
         # Generate consistent seed based on driver name
         driver_hash = hash(driver_name) % 1000
-        random.seed(driver_hash)
+        rng = np.random.default_rng(driver_hash)
         
         # Performance modifiers based on driver
         performance_modifier = (driver_hash % 20) - 10
@@ -1077,55 +1083,56 @@ class F1APIService:
         else:
             base_lap_time = 85 - lap_time_modifier
         
-        # Generate telemetry for each lap
-        for lap in range(1, actual_laps + 1):
-            # Base values with driver-specific modifiers
-            base_speed = 280 + speed_modifier + random.uniform(-20, 20)
-            base_rpm = 12000 + random.uniform(-500, 500)
-            
-            # Tire wear increases over time
-            tire_wear_rate = 1.8 + (consistency_modifier * 0.1)
-            tire_wear = min(100, (lap / actual_laps) * 100 * tire_wear_rate + random.uniform(-5, 5))
-            
-            # Tire temperature
-            tire_temp = 90 + (tire_wear * 0.3) + random.uniform(-5, 5)
-            
-            # Lap time - use actual fastest lap as reference if available
-            lap_time = base_lap_time + (tire_wear * 0.1) + random.uniform(-2, 2) / consistency_modifier
-            
-            # Sector time
-            sector_time = lap_time / 3 + random.uniform(-0.5, 0.5) / consistency_modifier
-            
-            # Position - maintain actual position if available, otherwise simulate
-            if actual_position:
-                # Small variations around actual position
-                position = max(1, min(20, actual_position + int(random.uniform(-1, 1))))
-            else:
-                position_variation = int(random.uniform(-3, 3) - (performance_modifier / 3))
-                position = max(1, min(20, start_position + position_variation + (lap // 15)))
-            
-            # Speed
-            speed = base_speed - (tire_wear * 0.5) + random.uniform(-10, 10)
-            
-            # RPM
-            rpm = base_rpm + (speed - 280) * 10 + random.uniform(-200, 200)
-            
-            timestamp = base_time + timedelta(seconds=lap * lap_time)
-            
-            data_points.append({
-                'speed': round(speed, 2),
-                'rpm': round(rpm, 0),
-                'lap_time': round(lap_time, 3),
-                'tire_temp': round(tire_temp, 1),
-                'tire_wear': round(tire_wear, 1),
-                'sector_time': round(sector_time, 3),
-                'position': position,
-                'timestamp': timestamp,
-                'lap': lap
-            })
-        
-        # Reset random seed
-        random.seed()
+        # Generate telemetry for all laps at once (one array element per lap)
+        laps = np.arange(1, actual_laps + 1)
+        
+        # Base values with driver-specific variations
+        base_speed = 280 + speed_modifier + rng.uniform(-20, 20, actual_laps)
+        base_rpm = 12000 + rng.uniform(-500, 500, actual_laps)
+        
+        # Tire wear increases progressively
+        tire_wear_rate = 1.8 + (consistency_modifier * 0.1)
+        tire_wear = np.minimum(100, (laps / actual_laps) * 100 * tire_wear_rate + rng.uniform(-5, 5, actual_laps))
+        
+        # Tire temperature correlates with wear
+        tire_temp = 90 + (tire_wear * 0.3) + rng.uniform(-5, 5, actual_laps)
+        
+        # Lap time degrades with tire wear
+        lap_time = base_lap_time + (tire_wear * 0.1) + rng.uniform(-2, 2, actual_laps) / consistency_modifier
+        
+        # Sector time (approximately 1/3 of lap)
+        sector_time = lap_time / 3 + rng.uniform(-0.5, 0.5, actual_laps) / consistency_modifier
+        
+        # Position changes slightly over race (offsets truncate toward zero)
+        if actual_position:
+            position = actual_position + np.trunc(rng.uniform(-1, 1, actual_laps))
+        else:
+            position_variation = np.trunc(rng.uniform(-3, 3, actual_laps) - (performance_modifier / 3))
+            position = start_position + position_variation + (laps // 15)
+        position = np.clip(position, 1, 20).astype(int)
+        
+        # Speed reduces as tires wear
+        speed = base_speed - (tire_wear * 0.5) + rng.uniform(-10, 10, actual_laps)
+        
+        # RPM correlates with speed
+        rpm = base_rpm + (speed - 280) * 10 + rng.uniform(-200, 200, actual_laps)
+        
+        timestamps = [base_time + timedelta(seconds=offset) for offset in (laps * lap_time).tolist()]
+        
+        # Convert to per-lap dictionaries only once all columns are computed
+        columns = (
+            np.round(speed, 2).tolist(),
+            np.round(rpm, 0).tolist(),
+            np.round(lap_time, 3).tolist(),
+            np.round(tire_temp, 1).tolist(),
+            np.round(tire_wear, 1).tolist(),
+            np.round(sector_time, 3).tolist(),
+            position.tolist(),
+            timestamps,
+            laps.tolist(),
+        )
+        data_points = [dict(zip(TELEMETRY_KEYS, row)) for row in zip(*columns)]
+
         
         return data_points
     
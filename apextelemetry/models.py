@@ -21,13 +21,18 @@ class RaceSession(db.Model):
     driver_name = db.Column(db.String(100), nullable=False)
     race_date = db.Column(db.DateTime, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     car_data = db.relationship('CarData', backref='session', lazy=True, cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<RaceSession {self.name}>'
 
 class CarData(db.Model):
+    __table_args__ = (
+        # Serves session lookups and the timestamp ordering of chart queries
+        db.Index('ix_car_data_session_timestamp', 'session_id', 'timestamp'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     session_id = db.Column(db.Integer, db.ForeignKey('race_session.id'), nullable=False)
     speed = db.Column(db.Float, nullable=False)  # km/h
@@ -43,15 +48,20 @@ class CarData(db.Model):
         return f'<CarData {self.id}>'
 
 class Comparison(db.Model):
+    __table_args__ = (
+        # Serves the dashboard's per-user, newest-first listing
+        db.Index('ix_comparison_user_created', 'user_id', 'created_at'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     driver1_name = db.Column(db.String(100), nullable=False)
     driver2_name = db.Column(db.String(100), nullable=False)
-    data1 = db.Column(db.Text, nullable=False)  # JSON string
-    data2 = db.Column(db.Text, nullable=False)  # JSON string
-    race_date = db.Column(db.String(50))
+    data1 = db.Column(db.JSON, nullable=False)  # Per-lap telemetry records
+    data2 = db.Column(db.JSON, nullable=False)  # Per-lap telemetry records
+    race_date = db.Column(db.Date)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    user = db.relationship('User', backref=db.backref('comparisons', lazy=True))
+    user = db.relationship('User', backref=db.backref('comparisons', lazy='raise_on_sql'))
     
     def __repr__(self):
         return f'<Comparison {self.driver1_name} vs {self.driver2_name}>'